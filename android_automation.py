@@ -1,34 +1,187 @@
+import argparse
+import io
 import os
 import re
-import xml.etree.ElementTree as ET
-from xml.dom import minidom
+import shutil
+import sys
+from functools import lru_cache
+
+try:
+    # libxml2 parses noticeably faster than expat when lxml is installed
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+
+# Matches both the Kotlin DSL (applicationId = "...") and Groovy (applicationId "..." or '...') forms;
+# the closing quote must match the opening one
+_APPLICATION_ID_RE = re.compile(r'applicationId\s*=?\s*(["\'])([^"\']+)\1')
+
+# Folders that cannot contain the app module's build file
+_SKIPPED_GRADLE_DIRS = frozenset({"build", ".gradle", ".git", "node_modules", "src"})
+
+ANDROID_NS = "http://schemas.android.com/apk/res/android"
+
+# Used to splice new permissions into the manifest without re-serializing it
+_MANIFEST_END_RE = re.compile(r'</manifest>\s*$', re.MULTILINE)
+_XML_COMMENT_RE = re.compile(rb'<!--.*?-->', re.DOTALL)
+
+# Each permission tier extends the one below it
+BASIC_PERMISSIONS = (
+    "android.permission.INTERNET",
+    "android.permission.ACCESS_NETWORK_STATE",
+    "android.permission.ACCESS_WIFI_STATE",
+    "android.permission.READ_EXTERNAL_STORAGE",
+)
+BEGINNER_PERMISSIONS = BASIC_PERMISSIONS + (
+    "android.permission.CAMERA",
+    "android.permission.ACCESS_FINE_LOCATION",
+    "android.permission.BLUETOOTH",
+)
+INTERMEDIATE_PERMISSIONS = BEGINNER_PERMISSIONS + (
+    "android.permission.READ_SMS",
+    "android.permission.WRITE_SETTINGS",
+    "android.permission.BLUETOOTH_ADMIN",
+    "android.permission.ACCESS_COARSE_LOCATION",
+)
+ADVANCED_PERMISSIONS = INTERMEDIATE_PERMISSIONS + (
+    "android.permission.USE_BIOMETRIC",
+    "android.permission.INSTALL_PACKAGES",
+    "android.permission.REQUEST_INSTALL_PACKAGES",
+)
+
+PERMISSIONS = {
+    "basic": BASIC_PERMISSIONS,
+    "beginner": BEGINNER_PERMISSIONS,
+    "intermediate": INTERMEDIATE_PERMISSIONS,
+    "advanced": ADVANCED_PERMISSIONS,
+}
+PERMISSION_LEVELS = tuple(PERMISSIONS)
+_PERMISSION_CHOICES = {"1": "basic", "2": "beginner", "3": "intermediate", "4": "advanced"}
+
+# Candidate dependencies blocks of a module build file, at any indentation
+_DEPENDENCIES_BLOCK_RE = re.compile(r'^[ \t]*dependencies\s*\{', re.MULTILINE)
+# Comments and string literals, whose braces must not count towards block nesting
+_GRADLE_NOISE_RE = re.compile(r'//[^\n]*|/\*.*?\*/|""".*?"""|"(?:\\.|[^"\\\n])*"|\'(?:\\.|[^\'\\\n])*\'', re.DOTALL)
+
+# Only the leaf folders are listed; makedirs creates their parents (the layer folders)
+CLEAN_ARCHITECTURE_FOLDERS = (
+    os.path.join("domain", "models"),
+    os.path.join("domain", "usecases"),
+    os.path.join("data", "repository"),
+    os.path.join("data", "local"),
+    os.path.join("data", "remote"),
+    os.path.join("presentation", "ui"),
+    os.path.join("presentation", "viewmodels"),
+)
+
+# README.md content written to each Clean Architecture layer folder
+LAYER_READMES = {
+    "domain": (
+        "This layer contains business logic and domain models.\n\n"
+        "- `models`: Define core business objects.\n"
+        "- `usecases`: Represent operations the application can perform."
+    ),
+    "data": (
+        "This layer handles data operations.\n\n"
+        "- `repository`: Interfaces and implementations for data access.\n"
+        "- `local`: Local data sources, like Room database.\n"
+        "- `remote`: Remote data sources, like APIs."
+    ),
+    "presentation": (
+        "This layer manages the UI and user interaction.\n\n"
+        "- `ui`: Activities, Fragments, and Composable.\n"
+        "- `viewmodels`: ViewModels for managing UI-related data."
+    ),
+}
+
+# Dependency snippets added by method 1, keyed by the names accepted on the command line
+DEPENDENCIES = {
+    "glide": "\t// Glide\n    implementation(\"com.github.bumptech.glide:glide:4.16.0\")\n",
+    "lifecycle": "\t// Lifecycle\n    implementation(\"androidx.lifecycle:lifecycle-runtime-ktx:2.6.1\")\n"
+                 "    implementation(\"androidx.lifecycle:lifecycle-viewmodel-ktx:2.6.1\")\n",
+    "hilt": "\t// Hilt\n    implementation(\"com.google.dagger:hilt-android:2.51.1\")\n"
+            "    kapt(\"com.google.dagger:hilt-compiler:2.51.1\")\n",
+    "retrofit": "\t// Retrofit & OkHttp\n    implementation(\"com.squareup.retrofit2:retrofit:2.9.0\")\n"
+                "    implementation(\"com.squareup.okhttp3:okhttp:4.11.0\")\n",
+    "room": "\t// Room\n    implementation(\"androidx.room:room-runtime:2.6.0\")\n"
+            "    kapt(\"androidx.room:room-compiler:2.6.0\")\n",
+    "coroutines": "\t// Coroutine support\n    implementation(\"org.jetbrains.kotlinx:kotlinx-coroutines-android:1.7.3\")\n",
+}
+
+
+def write_file(path, content):
+    """
+    Write content to a file as UTF-8 through a temporary file, so the original is never left half-written.
+    """
+    temp_path = path + ".tmp"
+    try:
+        with open(temp_path, "w", encoding="utf-8", newline="\n") as file:
+            file.write(content)
+            file.flush()
+            os.fsync(file.fileno())
+        # Keep the original file's permission bits
+        if os.path.exists(path):
+            shutil.copymode(path, temp_path)
+        os.replace(temp_path, path)
+    except BaseException:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+        raise
 
 
 def find_build_gradle(base_path):
     """
     Locate the build.gradle or build.gradle.kts file in the 'app' folder under the base path.
     Automatically appends 'app' to the base path if not already included.
+    Results are cached per project; call find_build_gradle.cache_clear() if the tree changes.
     """
+    return _find_build_gradle(os.path.realpath(base_path))
+
+
+@lru_cache(maxsize=256)
+def _find_build_gradle(base_path):
     # Ensure the path includes 'app'
     app_folder = os.path.join(base_path, "app")
-    
-    for root, _, files in os.walk(app_folder):
-        for file in files:
-            if file in ("build.gradle", "build.gradle.kts"):
-                return os.path.join(root, file)
+
+    # The module build file almost always sits directly in the app folder
+    for name in ("build.gradle.kts", "build.gradle"):
+        gradle_path = os.path.join(app_folder, name)
+        if os.path.isfile(gradle_path):
+            return gradle_path
+
+    # Fall back to a scan that skips folders which never hold the module build file
+    stack = [app_folder]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name not in _SKIPPED_GRADLE_DIRS:
+                            stack.append(entry.path)
+                    elif entry.is_file(follow_symlinks=False) and entry.name in ("build.gradle", "build.gradle.kts"):
+                        return entry.path
+        except OSError:
+            continue
     return None
 
 
+find_build_gradle.cache_clear = _find_build_gradle.cache_clear
+
+
 def extract_application_id(gradle_file):
     """
     Extract the applicationId from the build.gradle or build.gradle.kts file.
     """
     try:
-        with open(gradle_file, "r") as file:
-            content = file.read()
-            match = re.search(r'applicationId\s*=\s*"([^"]+)"', content)
-            if match:
-                return match.group(1)
+        with open(gradle_file, "r", encoding="utf-8") as file:
+            # Stop at the first match instead of reading the whole file
+            for line in file:
+                if "applicationId" not in line:
+                    continue
+                match = _APPLICATION_ID_RE.search(line)
+                if match:
+                    return match.group(2)
     except Exception as e:
         return f"Error reading gradle file: {e}"
     return "applicationId not found"
@@ -40,68 +193,66 @@ def create_readme(folder_path, content):
     """
     try:
         readme_path = os.path.join(folder_path, "README.md")
-        with open(readme_path, "w") as readme_file:
-            readme_file.write(content)
+        write_file(readme_path, content)
         print(f"README created at: {readme_path}")
     except Exception as e:
         print(f"Error creating README: {e}")
 
 
-def create_folders(base_path, package_name):
+def create_folders(base_path, package_parts):
     """
-    Create a Clean Architecture folder structure for an Android project.
+    Create a Clean Architecture folder structure for an Android project,
+    adding a README.md to each layer to explain its purpose.
+    package_parts is the package name split on dots, e.g. ("com", "example", "app").
     """
-    print(f"Package name: {package_name}")
+    print(f"Package name: {'.'.join(package_parts)}")
     try:
-        # Replace dots in the package name with slashes to create folder structure
-        package_path = package_name.replace(".", "/")
-        # Define the folder structure
-        folders = [
-            os.path.join(base_path, f"app/src/main/java/{package_path}"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/domain"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/domain/models"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/domain/usecases"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/data"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/data/repository"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/data/local"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/data/remote"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/presentation"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/presentation/ui"),
-            os.path.join(base_path, f"app/src/main/java/{package_path}/presentation/viewmodels"),
-        ]
-
-        # Create folders
-        for folder in folders:
-            os.makedirs(folder, exist_ok=True)
+        # Join the base path once, with the package parts as folders
+        base_java = os.path.join(base_path, "app", "src", "main", "java", *package_parts)
+
+        # Create folders, writing each layer's README as soon as its first leaf has created the layer folder
+        pending_readmes = dict(LAYER_READMES)
+        for folder in CLEAN_ARCHITECTURE_FOLDERS:
+            os.makedirs(base_java + os.sep + folder, exist_ok=True)
+            layer = folder.partition(os.sep)[0]
+            readme_content = pending_readmes.pop(layer, None)
+            if readme_content is not None:
+                create_readme(base_java + os.sep + layer, readme_content)
 
         print(f"Clean Architecture folder structure created successfully at {base_path}")
     except Exception as e:
         print(f"Error creating folders: {e}")
 
 
-def add_readmes(base_path, package_name):
+def find_manifest_file(base_path):
     """
-    Add README.md files to explain each layer in Clean Architecture.
+    Locate the AndroidManifest.xml file in the app folder.
+    Results are cached per project; call find_manifest_file.cache_clear() if the tree changes.
     """
-    readme_contents = {
-        "domain": "This layer contains business logic and domain models.\n\n- `models`: Define core business objects.\n- `usecases`: Represent operations the application can perform.",
-        "data": "This layer handles data operations.\n\n- `repository`: Interfaces and implementations for data access.\n- `local`: Local data sources, like Room database.\n- `remote`: Remote data sources, like APIs.",
-        "presentation": "This layer manages the UI and user interaction.\n\n- `ui`: Activities, Fragments, and Composable.\n- `viewmodels`: ViewModels for managing UI-related data.",
-    }
+    return _find_manifest_file(os.path.realpath(base_path))
+
 
-    package_path = package_name.replace(".", "/")
+@lru_cache(maxsize=256)
+def _find_manifest_file(base_path):
+    manifest_path = os.path.join(base_path, "app/src/main/AndroidManifest.xml")
+    return manifest_path if os.path.exists(manifest_path) else None
 
-    for layer, content in readme_contents.items():
-        folder_path = os.path.join(base_path, f"app/src/main/java/{package_path}/{layer}")
-        create_readme(folder_path, content)
 
+find_manifest_file.cache_clear = _find_manifest_file.cache_clear
 
-def find_manifest_file(base_path):
+
+def read_existing_permissions(manifest_file):
     """
-    Locate the AndroidManifest.xml file in the app folder.
+    Collect the permission names declared in the AndroidManifest.xml file, given as a path or a binary file object.
+    Streams the file so large merged manifests are never held as a full tree.
     """
-    manifest_path = os.path.join(base_path, "app/src/main/AndroidManifest.xml")
-    return manifest_path if os.path.exists(manifest_path) else None
+    name_attr = f"{{{ANDROID_NS}}}name"
+    existing_permissions = set()
+    for _, elem in ET.iterparse(manifest_file, events=("end",)):
+        if elem.tag == "uses-permission":
+            existing_permissions.add(elem.get(name_attr))
+        elem.clear()
+    return existing_permissions
 
 
 def add_permissions(manifest_path, permissions):
@@ -109,25 +260,29 @@ def add_permissions(manifest_path, permissions):
     Add permissions to the AndroidManifest.xml file.
     """
     try:
-        tree = ET.parse(manifest_path)
-        root = tree.getroot()
+        with open(manifest_path, "rb") as file:
+            raw = file.read()
 
-        # Android namespace
-        android_ns = "http://schemas.android.com/apk/res/android"
-        ET.register_namespace("android", android_ns)
+        # Cheap byte search first; the XML is only parsed if something looks missing.
+        # Comments are left out so a commented-out permission does not count as declared, and
+        # the tag is part of the needle so other elements (uses-permission-sdk-23, permission) do not either.
+        searchable = _XML_COMMENT_RE.sub(b"", raw) if b"<!--" in raw else raw
+        needed = [p for p in permissions if f'<uses-permission android:name="{p}"'.encode() not in searchable]
 
         # Check existing permissions
-        existing_permissions = {elem.get(f"{{{android_ns}}}name") for elem in root.findall("uses-permission")}
-
-        added_permissions = []
-        for permission in permissions:
-            if permission not in existing_permissions:
-                ET.SubElement(root, "uses-permission", {f"{{{android_ns}}}name": permission})
-                added_permissions.append(permission)
+        existing_permissions = read_existing_permissions(io.BytesIO(raw)) if needed else set()
+        added_permissions = sorted(frozenset(needed) - existing_permissions)
 
-        # Save changes
+        # Splice the new entries in just before </manifest> so formatting and comments survive
         if added_permissions:
-            tree.write(manifest_path, encoding="utf-8", xml_declaration=True)
+            content = raw.decode("utf-8").replace("\r\n", "\n")
+            end_match = _MANIFEST_END_RE.search(content)
+            if not end_match:
+                print("Error updating AndroidManifest.xml: closing </manifest> tag not found.")
+                return
+            new_lines = "\n".join(f'    <uses-permission android:name="{p}" />' for p in added_permissions)
+            content = content[:end_match.start()] + new_lines + "\n" + content[end_match.start():]
+            write_file(manifest_path, content)
             print(f"Added permissions: {', '.join(added_permissions)}")
         else:
             print("All permissions already exist in the AndroidManifest.xml file.")
@@ -136,76 +291,25 @@ def add_permissions(manifest_path, permissions):
         print(f"Error updating AndroidManifest.xml: {e}")
 
 
-def main(app_folder):
-    permissions = {
-        "basic": [
-            "android.permission.INTERNET",
-            "android.permission.ACCESS_NETWORK_STATE",
-            "android.permission.ACCESS_WIFI_STATE",
-            "android.permission.READ_EXTERNAL_STORAGE"
-        ],
-        "beginner": [
-            "android.permission.INTERNET",
-            "android.permission.ACCESS_NETWORK_STATE",
-            "android.permission.ACCESS_WIFI_STATE",
-            "android.permission.READ_EXTERNAL_STORAGE",
-            "android.permission.CAMERA",
-            "android.permission.ACCESS_FINE_LOCATION",
-            "android.permission.BLUETOOTH"
-        ],
-        "intermediate": [
-        	"android.permission.INTERNET",
-            "android.permission.ACCESS_NETWORK_STATE",
-            "android.permission.ACCESS_WIFI_STATE",
-            "android.permission.READ_EXTERNAL_STORAGE",
-            "android.permission.CAMERA",
-            "android.permission.ACCESS_FINE_LOCATION",
-            "android.permission.BLUETOOTH",
-            "android.permission.READ_SMS",
-            "android.permission.WRITE_SETTINGS",
-            "android.permission.BLUETOOTH_ADMIN",
-            "android.permission.ACCESS_COARSE_LOCATION"
-        ],
-        "advanced": [
-        	"android.permission.INTERNET",
-            "android.permission.ACCESS_NETWORK_STATE",
-            "android.permission.ACCESS_WIFI_STATE",
-            "android.permission.READ_EXTERNAL_STORAGE",
-            "android.permission.CAMERA",
-            "android.permission.ACCESS_FINE_LOCATION",
-            "android.permission.BLUETOOTH",
-            "android.permission.READ_SMS",
-            "android.permission.WRITE_SETTINGS",
-            "android.permission.BLUETOOTH_ADMIN",
-            "android.permission.ACCESS_COARSE_LOCATION",
-            "android.permission.USE_BIOMETRIC",
-            "android.permission.INSTALL_PACKAGES",
-            "android.permission.REQUEST_INSTALL_PACKAGES"
-        ]
-    }
-
-    # Prompt the user for category choice
-    print("Select the permission category to add:")
-    print("1. Basic")
-    print("2. Beginner")
-    print("3. Intermediate")
-    print("4. Advanced")
-    
+def main(app_folder, permission_level=None, assume_yes=False):
+    """
+    Add a category of permissions to the AndroidManifest.xml file.
+    Prompts for the category when permission_level is not given and for confirmation unless assume_yes is set.
+    Without a terminal to prompt on, the confirmation is treated as declined unless assume_yes is set.
+    """
+    if permission_level is None:
+        # Prompt the user for category choice
+        print("Select the permission category to add:\n1. Basic\n2. Beginner\n3. Intermediate\n4. Advanced")
 
-    category_choice = input("Enter your choice (1/2/3/4): ").strip()
-
-    # Map user choice to corresponding permissions
-    if category_choice == "1":
-        selected_permissions = permissions["basic"]
-    elif category_choice == "2":
-        selected_permissions = permissions["beginner"]
-    elif category_choice == "3":
-        selected_permissions = permissions["intermediate"]
-    elif category_choice == "4":
-        selected_permissions = permissions["advanced"]
-    else:
-        print("Invalid choice! Exiting...")
-        return
+        category_choice = input("Enter your choice (1/2/3/4): ").strip()
+
+        # Map user choice to corresponding permissions
+        permission_level = _PERMISSION_CHOICES.get(category_choice)
+        if permission_level is None:
+            print("Invalid choice! Exiting...")
+            return
+
+    selected_permissions = PERMISSIONS[permission_level]
 
     # # Get the base path for the Android project
     # app_folder = input("Enter the path to your Android app folder: ").strip()
@@ -217,13 +321,10 @@ def main(app_folder):
         print(f"Manifest file found at: {manifest_file}")
         
         # Confirm permissions with the user
-        print("The following permissions will be added:")
-        for permission in selected_permissions:
-            print(f"- {permission}")
+        print("The following permissions will be added:\n" + "\n".join(f"- {p}" for p in selected_permissions))
         
-        confirm = input("Do you want to add these permissions? (yes/no): ").strip().lower()
-        if confirm in ("yes", "y"):
-            add_permissions(manifest_file, selected_permissions)
+        if assume_yes or (sys.stdin.isatty() and input("Do you want to add these permissions? (yes/no): ").strip().lower() in ("yes", "y")):
+            add_permissions(manifest_file, frozenset(selected_permissions))
         else:
             print("Permission addition skipped.")
     else:
@@ -231,50 +332,57 @@ def main(app_folder):
 
 
 
-def add_dependencies_method_1(build_gradle_file):
+def find_dependencies_block(content):
     """
-    Adds dependencies using method 1 (directly specifying versions) in the build.gradle file.
-    Prompts for confirmation before adding each dependency.
+    Find the top-level dependencies block, skipping ones nested in other blocks such as buildscript { }.
+    Comments and strings are blanked out first (keeping offsets) so their braces are ignored.
     """
-    dependencies = [
-        "\t// Glide\n    implementation(\"com.github.bumptech.glide:glide:4.16.0\")\n",
-        "\t// Lifecycle\n    implementation(\"androidx.lifecycle:lifecycle-runtime-ktx:2.6.1\")\n",
-        "    implementation(\"androidx.lifecycle:lifecycle-viewmodel-ktx:2.6.1\")\n",
-        "\t// Hilt\n    implementation(\"com.google.dagger:hilt-android:2.51.1\")\n",
-        "    kapt(\"com.google.dagger:hilt-compiler:2.51.1\")\n",
-        "\t// Retrofit & OkHttp\n    implementation(\"com.squareup.retrofit2:retrofit:2.9.0\")\n",
-        "    implementation(\"com.squareup.okhttp3:okhttp:4.11.0\")\n",
-        "\t// Room\n    implementation(\"androidx.room:room-runtime:2.6.0\")\n",
-        "    kapt(\"androidx.room:room-compiler:2.6.0\")\n",
-        "\t// Coroutine support\n    implementation(\"org.jetbrains.kotlinx:kotlinx-coroutines-android:1.7.3\")\n"
-    ]
+    code = _GRADLE_NOISE_RE.sub(lambda m: re.sub(r'[^\n]', " ", m.group()), content)
+    depth = 0
+    scanned_to = 0
+    for match in _DEPENDENCIES_BLOCK_RE.finditer(code):
+        scanned = code[scanned_to:match.start()]
+        depth += scanned.count("{") - scanned.count("}")
+        scanned_to = match.start()
+        if depth == 0:
+            return match
+    return None
+
 
+def add_dependencies_method_1(build_gradle_file, selected_dependencies=None):
+    """
+    Adds dependencies using method 1 (directly specifying versions) in the build.gradle file.
+    Adds the named selected_dependencies, or prompts for confirmation before adding each dependency when none are given.
+    """
     try:
-        with open(build_gradle_file, "r") as file:
-            lines = file.readlines()
+        with open(build_gradle_file, "r", encoding="utf-8") as file:
+            content = file.read()
 
         # Find the dependencies block
-        with open(build_gradle_file, "w") as file:
-            inside_dependencies = False
-            for line in lines:
-                stripped_line = line.strip()
-
-                # Check for the start of the dependencies block
-                if stripped_line == "dependencies {":
-                    inside_dependencies = True
-                    file.write(line)  # Write the current line
-                    # Prompt for each dependency
-                    for dep in dependencies:
-                        add_dependency = input(f"Do you want to add:\n{dep} (yes/no)? ").strip().lower()
-                        if add_dependency in ['yes', 'y']:
-                            file.write(f"{dep}\n")  # Write the dependency with proper formatting
-                    continue
+        block_match = find_dependencies_block(content)
+        if not block_match:
+            print("dependencies block not found in build.gradle.")
+            return
+        # Insert on the line after the opening brace, or right after it when the block continues on the same line
+        insert_at = block_match.end()
+        line_end = content.find("\n", insert_at)
+        rest_of_line = content[insert_at:] if line_end == -1 else content[insert_at:line_end]
+        if line_end != -1 and (not rest_of_line.strip() or rest_of_line.strip().startswith("//")):
+            insert_at, prefix = line_end + 1, ""
+        else:
+            prefix = "\n"
 
-                # Check for the end of the dependencies block
-                if inside_dependencies and stripped_line == "}":
-                    inside_dependencies = False
+        # Ask for every dependency before touching the file
+        if selected_dependencies is None:
+            selected_dependencies = [
+                name for name, dep in DEPENDENCIES.items()
+                if input(f"Do you want to add:\n{dep} (yes/no)? ").strip().lower() in ['yes', 'y']
+            ]
+        approved = [f"{DEPENDENCIES[name]}\n" for name in selected_dependencies]  # Write each dependency with proper formatting
 
-                file.write(line)  # Write the line as is
+        if approved:
+            content = content[:insert_at] + prefix + "".join(approved) + content[insert_at:]
+            write_file(build_gradle_file, content)
 
         print("Dependencies successfully appended to the dependencies block where confirmed.")
     except Exception as e:
@@ -300,18 +408,49 @@ dagger-hilt-android = { id = "com.google.dagger.hilt.android", version.ref = "hi
     """
     
     try:
-        # Open the file in append mode ('a') to avoid overwriting
-        with open(libs_versions_toml_file, "a") as file:
-            file.write("\n" + toml_content.strip() + "\n")
+        # Keep the existing content and append to it to avoid overwriting
+        existing_content = ""
+        if os.path.exists(libs_versions_toml_file):
+            with open(libs_versions_toml_file, "r", encoding="utf-8") as file:
+                existing_content = file.read()
+        write_file(libs_versions_toml_file, existing_content + "\n" + toml_content.strip() + "\n")
         print("Dependencies added using Method 2 in libs.versions.toml.")
     except Exception as e:
         print(f"Error adding dependencies in libs.versions.toml: {e}")
 
 
 
+def parse_args(argv=None):
+    """
+    Parse the command line options used to run the setup without prompts.
+    """
+    parser = argparse.ArgumentParser(description="Set up a Clean Architecture structure in an Android project.")
+    parser.add_argument("--app-folder", help="Path to the Android project folder.")
+    parser.add_argument("--permission-level", choices=PERMISSION_LEVELS, help="Permission category to add to AndroidManifest.xml.")
+    parser.add_argument(
+        "--deps",
+        # Drop repeated names while keeping the given order
+        type=lambda value: list(dict.fromkeys(name.strip() for name in value.split(",") if name.strip())),
+        help=f"Comma-separated dependencies to add to build.gradle ({', '.join(DEPENDENCIES)}).",
+    )
+    parser.add_argument("-y", "--yes", action="store_true", help="Confirm the applicationId and the permissions without prompting. Dependencies are chosen with --deps.")
+    args = parser.parse_args(argv)
+
+    if args.deps is not None:
+        unknown = [name for name in args.deps if name not in DEPENDENCIES]
+        if unknown:
+            parser.error(f"unknown dependencies: {', '.join(unknown)}")
+    if not sys.stdin.isatty() and args.app_folder is None:
+        parser.error("--app-folder is required when not running interactively")
+    return args
+
+
 if __name__ == "__main__":
+    args = parse_args()
+    interactive = sys.stdin.isatty()
+
     # Specify your app folder
-    app_folder = input("Enter the path to your app folder: ").strip()
+    app_folder = args.app_folder or input("Enter the path to your app folder: ").strip()
 
     gradle_file = find_build_gradle(app_folder)
 
@@ -321,19 +460,16 @@ if __name__ == "__main__":
 
         if application_id and "not found" not in application_id:
             print(f"Extracted applicationId: {application_id}")
-            confirmation = input(f"Is the applicationId '{application_id}' correct? (yes/no): ").strip().lower()
-            if confirmation in ("yes", "y"):
+            if args.yes or (interactive and input(f"Is the applicationId '{application_id}' correct? (yes/no): ").strip().lower() in ("yes", "y")):
                 print("Confirmed!")
 
-                # Create folder structure
-                create_folders(app_folder, application_id)
-
-                # Add README.md files to explain each layer
-                add_readmes(app_folder, application_id)
+                # Create folder structure with a README.md explaining each layer
+                create_folders(app_folder, tuple(application_id.split(".")))
 
-                main(app_folder)
+                if args.permission_level or interactive:
+                    main(app_folder, args.permission_level, args.yes)
 
-                build_gradle_file = os.path.join(app_folder, "app", "build.gradle.kts")
+                build_gradle_file = gradle_file
                 libs_versions_toml_file = os.path.join(app_folder, "gradle", "libs.versions.toml")
 
                 # Check if libs.versions.toml exists
@@ -341,8 +477,9 @@ if __name__ == "__main__":
                 #     print("libs.versions.toml found. Using Method 2.")
                 #     add_dependencies_method_2(libs_versions_toml_file)
                 # else:
-                print("libs.versions.toml not found. Using Method 1.")
-                add_dependencies_method_1(build_gradle_file)
+                if args.deps is not None or interactive:
+                    print("libs.versions.toml not found. Using Method 1.")
+                    add_dependencies_method_1(build_gradle_file, args.deps)
 
             else:
                 print("Confirmation declined.")